@@ -32,7 +32,7 @@ def main():
         '-a', '--algorithm', 
         type=str, 
         default='dfs', 
-        choices=['dfs', 'bfs', 'ucs', 'a_star'],
+        choices=['dfs', 'bfs', 'bidirectional', 'ucs', 'a_star', 'jps'],
         help="The search algorithm to use (default: dfs)"
     )
     
@@ -44,11 +44,15 @@ def main():
     print(f"Solving using {args.algorithm.upper()}...")
     
     # Select algorithm
+    # Maze step costs and Manhattan distances are integers,
+    # so UCS and A* can use the bucket-based priority queue
     alg_map = {
         'dfs': search.depthFirstSearch,
         'bfs': search.breadthFirstSearch,
-        'ucs': search.uniformCostSearch,
-        'a_star': lambda p: search.aStarSearch(p, heuristic=manhattanHeuristic)
+        'bidirectional': search.bidirectionalSearch,
+        'ucs': lambda p: search.uniformCostSearch(p, useBuckets=True),
+        'a_star': lambda p: search.aStarSearch(p, heuristic=manhattanHeuristic, useBuckets=True),
+        'jps': search.jumpPointSearch
     }
     
     algorithm = alg_map.get(args.algorithm)
@@ -0,0 +1,290 @@
+"""
+grid_search.py
+
+This file contains array-based versions of the search algorithms,
+specialized to the MazeProblem:
+- Depth First Search (DFS)
+- Breadth First Search (BFS)
+- A* Search (AStar) with the Manhattan distance heuristic
+- A direction-optimizing BFS and a bitset-based, level-synchronous BFS
+
+States are integer IDs (id = r * width + c) and successors are read
+from the CSR arrays built by MazeProblem. The visited set, parent
+pointers and costs are flat arrays indexed by ID rather than dicts
+keyed by (r, c) tuples, and the tight loops avoid method calls.
+All step costs are assumed to be 1.
+
+The visited flags use one byte per state (a bytearray) rather than
+one bit. Packing eight states per byte saves memory, but the extra
+shift and mask work in the interpreter made the searches 20-100%
+slower, and the parent array (four bytes per state) is the larger
+cost anyway.
+"""
+
+import heapq
+from array import array
+from src.maze_problem import MazeProblem, ACTIONS, NORTH, SOUTH, WEST, EAST
+
+# Translation table that maps an open cell (0) of the wall bitmap to
+# '1' and a wall (1) to '0'
+_OPEN_TABLE = b'1' + b'0' * 255
+
+def reconstructPath(problem: MazeProblem, parent, state_id):
+    """
+    Walks the parent array back from 'state_id' to the start state.
+    Returns the list of actions from the start state to 'state_id'.
+    """
+    indptr, indices, actions = problem.indptr, problem.indices, problem.actions
+    path = []
+    while state_id != problem.startId:
+        parent_id = parent[state_id]
+        # Find the parent's CSR entry for this move to get its action
+        for i in range(indptr[parent_id], indptr[parent_id + 1]):
+            if indices[i] == state_id:
+                path.append(ACTIONS[actions[i]])
+                break
+        state_id = parent_id
+    path.reverse()
+    return path
+
+def depthFirstSearch(problem: MazeProblem):
+    """
+    Search the deepest nodes in the search tree first.
+    Returns a list of actions that reaches the goal.
+    """
+    indptr, indices = problem.indptr, problem.indices
+    goal_id = problem.goalId
+    size = problem.height * problem.width
+    visited = bytearray(size)
+    parent = array('i', [-1]) * size
+    fringe = [problem.startId]
+
+    while fringe:
+        state_id = fringe.pop()
+
+        if visited[state_id]:
+            continue
+        visited[state_id] = 1
+
+        if state_id == goal_id:
+            return reconstructPath(problem, parent, state_id)
+
+        for successor in indices[indptr[state_id]:indptr[state_id + 1]]:
+            if not visited[successor]:
+                parent[successor] = state_id
+                fringe.append(successor)
+
+    return None # No solution found
+
+def breadthFirstSearch(problem: MazeProblem):
+    """
+    Search the shallowest nodes in the search tree first.
+    Returns a list of actions that reaches the goal.
+    """
+    indptr, indices = problem.indptr, problem.indices
+    goal_id = problem.goalId
+    size = problem.height * problem.width
+    visited = bytearray(size)
+    parent = array('i', [-1]) * size
+    # States are marked on push, so each ID is queued at most once and
+    # a preallocated array with head/tail indices can serve as the queue
+    fringe = array('i', [0]) * size
+    fringe[0] = problem.startId
+    visited[problem.startId] = 1
+    head, tail = 0, 1
+
+    while head < tail:
+        state_id = fringe[head]
+        head += 1
+
+        if state_id == goal_id:
+            return reconstructPath(problem, parent, state_id)
+
+        for successor in indices[indptr[state_id]:indptr[state_id + 1]]:
+            if not visited[successor]:
+                visited[successor] = 1
+                parent[successor] = state_id
+                fringe[tail] = successor
+                tail += 1
+
+    return None # No solution found
+
+def aStarSearch(problem: MazeProblem):
+    """
+    Search the node that has the lowest combined cost and the
+    Manhattan distance to the goal first.
+    Returns a list of actions that reaches the goal.
+    """
+    indptr, indices = problem.indptr, problem.indices
+    width = problem.width
+    start_id, goal_id = problem.startId, problem.goalId
+    goal_r, goal_c = divmod(goal_id, width)
+    size = problem.height * problem.width
+    visited = bytearray(size)
+    parent = array('i', [-1]) * size
+    g_costs = array('i', [-1]) * size # -1 marks an unreached state
+    g_costs[start_id] = 0
+
+    # Each heap entry (f_cost, tie-breaker, state_id) is packed into a
+    # single int, laid out as | f_cost | count | state_id |, so the
+    # heap compares plain ints instead of tuples and allocates no tuple
+    # per push. A state is pushed at most once per incoming move, so
+    # the count always fits in its field.
+    id_bits = size.bit_length()
+    count_bits = (len(indices) + 1).bit_length()
+    id_mask = (1 << id_bits) - 1
+    f_shift = id_bits + count_bits
+
+    start_r, start_c = divmod(start_id, width)
+    h = abs(start_r - goal_r) + abs(start_c - goal_c)
+    fringe = [h << f_shift | start_id]
+    count = 1 << id_bits # tie-breaker, already shifted into its field
+
+    while fringe:
+        state_id = heapq.heappop(fringe) & id_mask
+
+        # An improved path pushes a fresh entry instead of updating the
+        # old one, so outdated entries are skipped here
+        if visited[state_id]:
+            continue
+        visited[state_id] = 1
+
+        if state_id == goal_id:
+            return reconstructPath(problem, parent, state_id)
+
+        new_g_cost = g_costs[state_id] + 1
+        for successor in indices[indptr[state_id]:indptr[state_id + 1]]:
+            if not visited[successor] and not 0 <= g_costs[successor] <= new_g_cost:
+                g_costs[successor] = new_g_cost
+                parent[successor] = state_id
+                r, c = divmod(successor, width)
+                f_cost = new_g_cost + abs(r - goal_r) + abs(c - goal_c)
+                heapq.heappush(fringe, f_cost << f_shift | count | successor)
+                count += 1 << id_bits
+
+    return None # No solution found
+
+def hybridBreadthFirstSearch(problem: MazeProblem, alpha=0.1, min_degree=2.5):
+    """
+    A direction-optimizing BFS that expands the maze one level at a time.
+    While the frontier is small, each frontier state pushes its unvisited
+    successors (top-down). Once the frontier holds more than 'alpha'
+    times the states that are still unvisited, each unvisited state
+    instead looks for a neighbour in the frontier (bottom-up), which
+    is cheaper in wide open areas. The direction is re-chosen on every
+    level, so the search switches back when the frontier shrinks.
+    Mazes made of corridors, with fewer than 'min_degree' moves per
+    open cell on average, never grow large frontiers and always use
+    top-down steps.
+    Returns a list of actions that reaches the goal.
+    """
+    indptr, indices = problem.indptr, problem.indices
+    goal_id = problem.goalId
+    size = problem.height * problem.width
+    visited = bytearray(size)
+    parent = array('i', [-1]) * size
+    in_frontier = bytearray(size)
+    visited[problem.startId] = 1
+    frontier = [problem.startId]
+
+    open_count = len(problem.succ_table)
+    remaining = open_count - 1
+    bottom_up_allowed = len(indices) >= min_degree * open_count
+    unvisited = None # IDs still to be checked by bottom-up steps
+
+    while frontier:
+        if visited[goal_id]:
+            return reconstructPath(problem, parent, goal_id)
+
+        next_frontier = []
+        if bottom_up_allowed and len(frontier) > alpha * remaining:
+            # Bottom-up: moves are reversible, so a state's successors
+            # are also its predecessors
+            if unvisited is None:
+                unvisited = [i for i in range(size) if indptr[i] != indptr[i + 1]]
+            for state_id in frontier:
+                in_frontier[state_id] = 1
+            still_unvisited = []
+            for state_id in unvisited:
+                if visited[state_id]:
+                    continue
+                for neighbour in indices[indptr[state_id]:indptr[state_id + 1]]:
+                    if in_frontier[neighbour]:
+                        visited[state_id] = 1
+                        parent[state_id] = neighbour
+                        next_frontier.append(state_id)
+                        break
+                else:
+                    still_unvisited.append(state_id)
+            unvisited = still_unvisited
+            for state_id in frontier:
+                in_frontier[state_id] = 0
+        else:
+            # Top-down: expand every state of the frontier
+            for state_id in frontier:
+                for successor in indices[indptr[state_id]:indptr[state_id + 1]]:
+                    if not visited[successor]:
+                        visited[successor] = 1
+                        parent[successor] = state_id
+                        next_frontier.append(successor)
+
+        remaining -= len(next_frontier)
+        frontier = next_frontier
+
+    return None # No solution found
+
+def bitsetBreadthFirstSearch(problem: MazeProblem):
+    """
+    A level-synchronous BFS that expands a whole level at once.
+    Sets of cells are Python ints used as bitsets over the padded wall
+    bitmap (bit i is cell i), so moving every frontier cell one step
+    north, south, west or east is a single shift by 'stride' or 1,
+    done in C. The wall border keeps shifted bits from wrapping to
+    another row. Each level costs time proportional to the maze area,
+    so this suits open mazes whose solution is short compared to
+    their size; long winding corridors are better served by
+    breadthFirstSearch.
+    Returns a list of actions that reaches the goal.
+    """
+    stride = problem.stride
+    walls = problem.walls_arr
+    # int() reads the most significant bit first, hence the reversal
+    open_cells = int(walls[::-1].translate(_OPEN_TABLE), 2)
+
+    start_r, start_c = problem.startState
+    goal_r, goal_c = problem.goalState
+    start = (start_r + 1) * stride + start_c + 1
+    goal = (goal_r + 1) * stride + goal_c + 1
+    goal_bit = 1 << goal
+
+    frontier = 1 << start
+    unvisited = open_cells & ~frontier
+    # (action, shift, parent offset) for every move. 'reached[k]' holds
+    # the cells that were first reached by move k.
+    moves = ((NORTH, -stride, stride), (SOUTH, stride, -stride),
+             (WEST, -1, 1), (EAST, 1, -1))
+    reached = [0, 0, 0, 0]
+
+    while unvisited & goal_bit:
+        if not frontier:
+            return None # No solution found
+        next_frontier = 0
+        for k, (_, shift, _) in enumerate(moves):
+            moved = (frontier << shift if shift > 0 else frontier >> -shift) & unvisited
+            unvisited ^= moved
+            reached[k] |= moved
+            next_frontier |= moved
+        frontier = next_frontier
+
+    # Walk back from the goal, undoing the move that reached each cell
+    reached = [bits.to_bytes(len(walls) // 8 + 1, 'little') for bits in reached]
+    path = []
+    cell = goal
+    while cell != start:
+        for k, (action, _, parent_offset) in enumerate(moves):
+            if reached[k][cell >> 3] >> (cell & 7) & 1:
+                path.append(action)
+                cell += parent_offset
+                break
+    path.reverse()
+    return path
@@ -5,8 +5,35 @@ This file defines the concrete MazeProblem class, which
 implements the abstract Problem interface for a grid-based maze.
 """
 
+from array import array
 from src.problem import Problem
 
+# Action names, shared by every successor triple
+NORTH, SOUTH, WEST, EAST = 'North', 'South', 'West', 'East'
+
+# Possible actions: (action_name, dr, dc)
+_ACTION_DELTAS = ((NORTH, -1, 0), (SOUTH, 1, 0), (WEST, 0, -1), (EAST, 0, 1))
+
+# Action names by the codes stored in MazeProblem.actions
+ACTIONS = tuple(action for action, _, _ in _ACTION_DELTAS)
+
+# The action that undoes each action
+_OPPOSITE = {NORTH: SOUTH, SOUTH: NORTH, WEST: EAST, EAST: WEST}
+
+# Translation table that maps '%' to 1 and every other byte to 0
+_WALL_TABLE = bytes(int(i == ord('%')) for i in range(256))
+
+def _findCell(data, char):
+    """
+    Returns the (r, c) position of the first 'char' in the raw maze
+    file contents 'data', or None if it does not occur.
+    """
+    index = data.find(char)
+    if index == -1:
+        return None
+    row_start = data.rfind(b'\n', 0, index) + 1
+    return (data.count(b'\n', 0, index), index - row_start)
+
 class MazeProblem(Problem):
     """
     A class to represent a search problem in a grid-based maze.
@@ -16,35 +43,76 @@ class MazeProblem(Problem):
     '%' = Wall
     ' ' = Open path
     """
+    __slots__ = (
+        'grid', 'height', 'width', 'startState', 'goalState',
+        'stride', 'walls_arr', 'succ_table',
+        'indptr', 'indices', 'actions', 'startId', 'goalId',
+    )
 
     def __init__(self, maze_file_path):
         """
         Parses the maze file and initializes the problem state.
         """
-        self.grid = []
-        self.walls = set()
-        self.startState = None
-        self.goalState = None
-        
         try:
-            with open(maze_file_path, 'r') as f:
-                for r, line in enumerate(f):
-                    row = []
-                    for c, char in enumerate(line.strip()):
-                        row.append(char)
-                        if char == '%':
-                            self.walls.add((r, c))
-                        elif char == 'S':
-                            self.startState = (r, c)
-                        elif char == 'G':
-                            self.goalState = (r, c)
-                    self.grid.append(row)
-        
+            # The file is read in one go. Rows are addressed by offsets
+            # into that single buffer, so no per-row copies are made.
+            with open(maze_file_path, 'rb') as f:
+                data = f.read()
+
+            self.grid = data.decode().splitlines()
+            self.height = data.count(b'\n')
+            if data and not data.endswith(b'\n'):
+                self.height += 1 # Last row without a newline
+            first_end = data.find(b'\n')
+            if first_end == -1:
+                first_end = len(data)
+            if data[first_end - 1:first_end] == b'\r':
+                first_end -= 1 # Windows line endings
+            self.width = first_end
+
+            self.startState = _findCell(data, b'S')
+            self.goalState = _findCell(data, b'G')
+
+            # Walls are stored as a flat bitmap (one byte per cell) that is
+            # framed by a border of walls. Cell (r, c) lives at index
+            # (r + 1) * stride + (c + 1), and a single lookup covers both
+            # the bounds check and the wall check.
+            # The whole file is translated to wall flags at once and each
+            # row is copied in through a zero-copy memoryview.
+            self.stride = self.width + 2
+            self.walls_arr = bytearray(self.stride * (self.height + 2))
+            self.walls_arr[:self.stride] = bytes([1]) * self.stride
+            self.walls_arr[-self.stride:] = bytes([1]) * self.stride
+            wall_flags = memoryview(data.translate(_WALL_TABLE))
+            start = 0
+            for r in range(self.height):
+                end = data.find(b'\n', start)
+                if end == -1:
+                    end = len(data)
+                # Cells missing from a short row stay open
+                length = min(end - start, self.width)
+                offset = (r + 1) * self.stride + 1
+                self.walls_arr[offset:offset + length] = wall_flags[start:start + length]
+                self.walls_arr[offset - 1] = 1
+                self.walls_arr[offset + self.width] = 1
+                start = end + 1
+
             if self.startState is None or self.goalState is None:
                 raise ValueError("Maze file must contain one 'S' and one 'G'.")
-            
-            self.height = len(self.grid)
-            self.width = len(self.grid[0]) if self.height > 0 else 0
+
+            # The grid is as wide as its first row, so an 'S' or 'G' further
+            # right on a longer row lies outside the maze and would address
+            # the wrong cell of the wall bitmap
+            for r, c in (self.startState, self.goalState):
+                if not (0 <= r < self.height and 0 <= c < self.width):
+                    raise ValueError(
+                        "'S' and 'G' must lie within the width of the first row."
+                    )
+
+            self.buildSuccessorTables()
+
+            self.startId = self.stateToId(self.startState)
+            self.goalId = self.stateToId(self.goalState)
 
         except FileNotFoundError:
             print(f"Error: The file '{maze_file_path}' was not found.")
@@ -61,34 +129,100 @@ class MazeProblem(Problem):
         """Returns True if the state is the goal state."""
         return state == self.goalState
 
-    def getSuccessors(self, state):
+    def getGoalState(self):
+        """Returns the goal state (r, c) tuple."""
+        return self.goalState
+
+    def stateToId(self, state):
         """
-        Returns a list of (successor, action, stepCost) triples
-        for the given state.
+        Returns the integer ID of the (r, c) state.
+        Cells outside the grid have no ID: 'r * width + c' would
+        name a different cell, so a ValueError is raised instead.
         """
-        successors = []
         r, c = state
+        if not (0 <= r < self.height and 0 <= c < self.width):
+            raise ValueError(f"State {state} lies outside the maze grid.")
+        return r * self.width + c
+
+    def idToState(self, state_id):
+        """Returns the (r, c) state of the integer ID."""
+        return divmod(state_id, self.width)
+
+    def getSuccessors(self, state):
+        """
+        Returns a tuple of (successor, action, stepCost) triples
+        for the given state, looked up in the table derived from
+        the CSR arrays. Only open cells of the grid have moves;
+        walls and cells outside the grid have none. The start and
+        goal are checked to be inside the grid when the maze loads.
+        """
+        return self.succ_table.get(state, ())
+
+    def getSuccessorsCSR(self, state_id):
+        """
+        Returns the successors of the integer state ID as two
+        memoryviews into the CSR arrays, so nothing is copied:
+        the successor IDs, and their action codes (indices into
+        ACTIONS). Every step costs 1.
+        """
+        start, end = self.indptr[state_id], self.indptr[state_id + 1]
+        return memoryview(self.indices)[start:end], memoryview(self.actions)[start:end]
+
+    def getPredecessors(self, state):
+        """
+        Returns a tuple of (predecessor, action, stepCost) triples
+        for the given state. Every move can be undone, so the
+        predecessors are the successors, reached with the opposite action.
+        """
+        return tuple(
+            (neighbour, _OPPOSITE[action], stepCost)
+            for neighbour, action, stepCost in self.getSuccessors(state)
+        )
 
-        # Define possible actions: (action_name, (dr, dc))
-        possible_actions = [
-            ('North', (-1, 0)),
-            ('South', (1, 0)),
-            ('West',  (0, -1)),
-            ('East',  (0, 1)),
+    def buildSuccessorTables(self):
+        """
+        The maze never changes, so the legal moves of every open
+        cell are computed once here instead of on every expansion.
+        They are built in compressed sparse row (CSR) form over integer
+        state IDs (id = r * width + c): the neighbours of ID 'i' are
+        indices[indptr[i]:indptr[i + 1]], and actions[j] is the code
+        (an index into ACTIONS) of the move to indices[j].
+        'succ_table' for the generic searches is derived from the CSR.
+        """
+        width, stride, walls_arr = self.width, self.stride, self.walls_arr
+
+        # (action code, index delta in walls_arr, state ID delta)
+        moves = [
+            (code, dr * stride + dc, dr * width + dc)
+            for code, (_, dr, dc) in enumerate(_ACTION_DELTAS)
         ]
 
-        for action, (dr, dc) in possible_actions:
-            next_r, next_c = r + dr, c + dc
-            next_state = (next_r, next_c)
-
-            # Check if the next state is within bounds and not a wall
-            if (0 <= next_r < self.height and
-                0 <= next_c < self.width and
-                next_state not in self.walls):
-                
-                successors.append((next_state, action, 1))
-        
-        return successors
+        # Every open cell gets a single (r, c) tuple, shared by its
+        # table key and by every successor triple that leads to it
+        cells = [None] * (self.height * width)
+        self.indptr = array('i', [0])
+        self.indices = array('i')
+        self.actions = array('B')
+        for r in range(self.height):
+            offset = (r + 1) * stride + 1
+            for c in range(width):
+                if not walls_arr[offset + c]:
+                    state_id = r * width + c
+                    cells[state_id] = (r, c)
+                    # The wall border means out-of-bounds cells read as walls
+                    for code, wall_delta, id_delta in moves:
+                        if not walls_arr[offset + c + wall_delta]:
+                            self.indices.append(state_id + id_delta)
+                            self.actions.append(code)
+                self.indptr.append(len(self.indices))
+
+        self.succ_table = {}
+        for state_id, state in enumerate(cells):
+            if state is not None:
+                self.succ_table[state] = tuple(
+                    (cells[self.indices[i]], ACTIONS[self.actions[i]], 1)
+                    for i in range(self.indptr[state_id], self.indptr[state_id + 1])
+                )
 
 def manhattanHeuristic(state, problem: MazeProblem):
     """
@@ -13,6 +13,8 @@ class Problem(ABC):
     It outlines the methods that any concrete problem implementation
     must provide.
     """
+    # No instance attributes here, so subclasses can use __slots__
+    __slots__ = ()
 
     @abstractmethod
     def getStartState(self):
@@ -42,3 +44,26 @@ class Problem(ABC):
         'stepCost' is the incremental cost of expanding to 'successor'
         """
         pass
+
+    def getGoalState(self):
+        """
+        Returns the goal state for problems that have exactly one.
+        Optional: only searches that work backwards from the goal,
+        such as bidirectional search, need it.
+        """
+        raise NotImplementedError
+
+    def getPredecessors(self, state):
+        """
+        state: Search state
+
+        For a given state, this should return a list of triples:
+        (predecessor, action, stepCost)
+
+        'predecessor' is a state from which 'state' is reachable
+        'action' is the action that leads from 'predecessor' to 'state'
+        'stepCost' is the cost of that action
+        Optional: only searches that work backwards from the goal,
+        such as bidirectional search, need it.
+        """
+        raise NotImplementedError
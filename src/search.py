@@ -6,34 +6,62 @@ This file contains the generic search algorithms:
 - Breadth First Search (BFS)
 - Uniform Cost Search (UCS)
 - A* Search (AStar)
+- Bidirectional Breadth First Search
+- Jump Point Search (JPS), specialized to mazes
 """
 
-from src.utils import Stack, Queue, PriorityQueue
+from src.utils import Stack, Queue, PriorityQueue, BucketPriorityQueue
 from src.problem import Problem
+from src.maze_problem import MazeProblem, NORTH, SOUTH, WEST, EAST
+
+# Cost of a state that has not been reached yet
+INF = float('inf')
+
+def reconstructPath(parents, state):
+    """
+    Walks the parent pointers back from 'state' to the start state.
+    'parents' maps each reached state to a (parent_state, action) pair,
+    with the start state mapped to (None, None).
+    Returns the list of actions from the start state to 'state'.
+    """
+    path = []
+    parent, action = parents[state]
+    while parent is not None:
+        path.append(action)
+        parent, action = parents[parent]
+    path.reverse()
+    return path
 
 def depthFirstSearch(problem: Problem):
     """
     Search the deepest nodes in the search tree first.
     Returns a list of actions that reaches the goal.
     """
+    # Bound methods are looked up once rather than on every pop
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
     fringe = Stack()
-    fringe.push((problem.getStartState(), [])) # (state, path_to_state)
+    start_state = problem.getStartState()
+    fringe.push(start_state)
+    parents = {start_state: (None, None)} # state -> (parent_state, action)
     visited = set()
 
     while not fringe.isEmpty():
-        state, path = fringe.pop()
+        state = fringe.pop()
 
         if state in visited:
             continue
         visited.add(state)
 
-        if problem.isGoalState(state):
-            return path
+        if isGoalState(state):
+            return reconstructPath(parents, state)
 
-        for successor, action, stepCost in problem.getSuccessors(state):
+        for successor, action, stepCost in getSuccessors(state):
             if successor not in visited:
-                new_path = path + [action]
-                fringe.push((successor, new_path))
+                # The most recent push of a state is always popped first,
+                # so the latest parent is the one that gets expanded.
+                parents[successor] = (state, action)
+                fringe.push(successor)
     
     return None # No solution found
 
@@ -42,68 +70,128 @@ def breadthFirstSearch(problem: Problem):
     Search the shallowest nodes in the search tree first.
     Returns a list of actions that reaches the goal.
     """
+    # Bound methods are looked up once rather than on every pop
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
     fringe = Queue()
-    fringe.push((problem.getStartState(), [])) # (state, path_to_state)
-    visited = set()
+    start_state = problem.getStartState()
+    fringe.push(start_state)
+    parents = {start_state: (None, None)} # state -> (parent_state, action)
+    # With equal step costs a state is first reached along a shortest
+    # path, so states are marked as visited *on push*. Each state then
+    # enters the queue at most once.
+    visited = {start_state}
 
     while not fringe.isEmpty():
-        state, path = fringe.pop()
+        state = fringe.pop()
 
-        if state in visited:
-            continue
-        visited.add(state)
+        if isGoalState(state):
+            return reconstructPath(parents, state)
 
-        if problem.isGoalState(state):
-            return path
-
-        for successor, action, stepCost in problem.getSuccessors(state):
+        for successor, action, stepCost in getSuccessors(state):
             if successor not in visited:
-                # To avoid adding the same state multiple times to the queue
-                # we can check if it's already in the fringe.
-                # For BFS, a simple 'visited' check on expansion is fine,
-                # but adding it here makes it more efficient.
-                # Let's add all successors and let the 'visited' check
-                # at popping handle cycles.
-                # A more optimized way:
-                # if successor not in visited:
-                #     visited.add(successor) # Mark as visited *on push*
-                #     new_path = path + [action]
-                #     fringe.push((successor, new_path))
-                
-                # The 'visited on pop' strategy is more general
-                # and works for UCS/A* as well.
-                new_path = path + [action]
-                fringe.push((successor, new_path))
+                visited.add(successor)
+                parents[successor] = (state, action)
+                fringe.push(successor)
     
     return None # No solution found
 
-def uniformCostSearch(problem: Problem):
+def uniformCostSearch(problem: Problem, useBuckets=False):
     """
     Search the node of least total cost first.
+    If all step costs are non-negative integers, 'useBuckets' switches
+    the fringe to a BucketPriorityQueue.
     Returns a list of actions that reaches the goal.
     """
-    fringe = PriorityQueue()
-    fringe.push((problem.getStartState(), [], 0), 0) # (state, path, cost), priority
+    # Bound methods are looked up once rather than on every pop
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    fringe = BucketPriorityQueue() if useBuckets else PriorityQueue()
+    start_state = problem.getStartState()
+    fringe.push(start_state, 0) # state, priority
+    parents = {start_state: (None, None)} # state -> (parent_state, action)
+    costs = {start_state: 0} # state -> cheapest known cost
     visited = set()
 
     while not fringe.isEmpty():
-        state, path, cost = fringe.pop()
-
-        if state in visited:
-            continue
+        # 'update' keeps a single live entry per state, so a popped
+        # state is never seen again.
+        state = fringe.pop()
+        cost = costs[state]
         visited.add(state)
 
-        if problem.isGoalState(state):
-            return path
+        if isGoalState(state):
+            return reconstructPath(parents, state)
 
-        for successor, action, stepCost in problem.getSuccessors(state):
-            if successor not in visited:
-                new_path = path + [action]
-                new_cost = cost + stepCost
-                fringe.push((successor, new_path, new_cost), new_cost)
+        for successor, action, stepCost in getSuccessors(state):
+            new_cost = cost + stepCost
+            if successor not in visited and new_cost < costs.get(successor, INF):
+                # Only a cheaper path replaces the recorded parent, so the
+                # parent always matches the entry that is popped.
+                costs[successor] = new_cost
+                parents[successor] = (state, action)
+                fringe.update(successor, new_cost)
     
     return None # No solution found
 
+def bidirectionalSearch(problem: Problem):
+    """
+    Runs two breadth first searches, one forward from the start state
+    and one backward from the goal state, and stops where they meet.
+    Each side only has to reach about half of the solution depth.
+    The problem must provide getGoalState and getPredecessors.
+    Returns a list of actions that reaches the goal.
+    """
+    start_state = problem.getStartState()
+    goal_state = problem.getGoalState()
+    if start_state == goal_state:
+        return []
+
+    # state -> (parent_state, action). In the backward map the 'parent'
+    # is the next state on the way to the goal.
+    forward_parents = {start_state: (None, None)}
+    backward_parents = {goal_state: (None, None)}
+    forward_frontier = [start_state]
+    backward_frontier = [goal_state]
+
+    def expandLevel(frontier, parents, other_parents, expand):
+        """
+        Expands a whole BFS level, marking states on push.
+        Returns the next frontier and the state where the two searches
+        met (or None). Since no state was in both maps before this
+        level, the first meeting state lies on a shortest path.
+        """
+        next_frontier = []
+        for state in frontier:
+            for neighbour, action, stepCost in expand(state):
+                if neighbour not in parents:
+                    parents[neighbour] = (state, action)
+                    if neighbour in other_parents:
+                        return next_frontier, neighbour
+                    next_frontier.append(neighbour)
+        return next_frontier, None
+
+    while forward_frontier and backward_frontier:
+        # Always grow the side with the smaller frontier
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = expandLevel(
+                forward_frontier, forward_parents, backward_parents,
+                problem.getSuccessors)
+        else:
+            backward_frontier, meeting = expandLevel(
+                backward_frontier, backward_parents, forward_parents,
+                problem.getPredecessors)
+
+        if meeting is not None:
+            path = reconstructPath(forward_parents, meeting)
+            next_state, action = backward_parents[meeting]
+            while next_state is not None:
+                path.append(action)
+                next_state, action = backward_parents[next_state]
+            return path
+
+    return None # No solution found
+
 def nullHeuristic(state, problem=None):
     """
     A heuristic function estimates the cost from the current state
@@ -112,33 +200,154 @@ def nullHeuristic(state, problem=None):
     """
     return 0
 
-def aStarSearch(problem: Problem, heuristic=nullHeuristic):
+def aStarSearch(problem: Problem, heuristic=nullHeuristic, useBuckets=False):
     """
     Search the node that has the lowest combined cost and heuristic first.
+    If all step costs and heuristic values are non-negative integers,
+    'useBuckets' switches the fringe to a BucketPriorityQueue.
     Returns a list of actions that reaches the goal.
     """
-    fringe = PriorityQueue()
+    # Bound methods are looked up once rather than on every pop
+    isGoalState = problem.isGoalState
+    getSuccessors = problem.getSuccessors
+    fringe = BucketPriorityQueue() if useBuckets else PriorityQueue()
     start_state = problem.getStartState()
     h = heuristic(start_state, problem)
-    fringe.push((start_state, [], 0), 0 + h) # (state, path, g_cost), f_cost
+    fringe.push(start_state, 0 + h) # state, f_cost
+    parents = {start_state: (None, None)} # state -> (parent_state, action)
+    g_costs = {start_state: 0} # state -> cheapest known g_cost
+    # A state can be relaxed several times, but its heuristic
+    # value never changes, so it is computed only once.
+    h_cache = {start_state: h}
     visited = set()
 
     while not fringe.isEmpty():
-        state, path, g_cost = fringe.pop()
-
-        if state in visited:
-            continue
+        state = fringe.pop()
+        g_cost = g_costs[state]
         visited.add(state)
 
-        if problem.isGoalState(state):
-            return path
+        if isGoalState(state):
+            return reconstructPath(parents, state)
 
-        for successor, action, stepCost in problem.getSuccessors(state):
-            if successor not in visited:
-                new_path = path + [action]
-                new_g_cost = g_cost + stepCost
-                h_cost = heuristic(successor, problem)
+        for successor, action, stepCost in getSuccessors(state):
+            new_g_cost = g_cost + stepCost
+            if successor not in visited and new_g_cost < g_costs.get(successor, INF):
+                g_costs[successor] = new_g_cost
+                parents[successor] = (state, action)
+                h_cost = h_cache.get(successor)
+                if h_cost is None:
+                    h_cost = heuristic(successor, problem)
+                    h_cache[successor] = h_cost
                 f_cost = new_g_cost + h_cost
-                fringe.push((successor, new_path, new_g_cost), f_cost)
+                fringe.update(successor, f_cost)
     
     return None # No solution found
+
+def jumpPointSearch(problem: MazeProblem):
+    """
+    Jump Point Search (JPS): an A* search specialized to 4-connected
+    mazes with unit step costs, guided by the Manhattan distance.
+    Instead of pushing every neighbour, it moves in a straight line
+    from each expanded cell until it reaches the goal or a 'jump point'
+    (a cell where a side passage opens up that the straight path
+    could not have reached as cheaply), and only pushes those.
+    Returns a list of actions that reaches the goal.
+    """
+    if not isinstance(problem, MazeProblem):
+        raise TypeError("jumpPointSearch only supports a MazeProblem.")
+
+    # Cells are indexed in the padded wall bitmap, where moving one
+    # cell changes the index by one of these deltas
+    walls = problem.walls_arr
+    stride = problem.stride
+    directions = {-stride: NORTH, stride: SOUTH, -1: WEST, 1: EAST}
+
+    def toIndex(state):
+        r, c = state
+        return (r + 1) * stride + c + 1
+
+    start, goal = toIndex(problem.startState), toIndex(problem.goalState)
+    goal_r, goal_c = divmod(goal, stride)
+
+    def heuristic(cell):
+        r, c = divmod(cell, stride)
+        return abs(r - goal_r) + abs(c - goal_c)
+
+    def jumpHorizontal(cell, d):
+        """Jumps from 'cell' along the row in direction 'd' (+1 or -1)."""
+        while not walls[cell]:
+            if cell == goal:
+                return cell
+            # A forced neighbour: the cell above or below is open,
+            # but the one diagonally behind it is a wall
+            if ((not walls[cell - stride] and walls[cell - d - stride]) or
+                (not walls[cell + stride] and walls[cell - d + stride])):
+                return cell
+            cell += d
+        return None
+
+    def jumpVertical(cell, d):
+        """Jumps from 'cell' along the column in direction 'd' (+/-stride)."""
+        while not walls[cell]:
+            if cell == goal:
+                return cell
+            if ((not walls[cell - 1] and walls[cell - d - 1]) or
+                (not walls[cell + 1] and walls[cell - d + 1])):
+                return cell
+            # A vertical move also stops where a horizontal jump succeeds
+            if (jumpHorizontal(cell + 1, 1) is not None or
+                jumpHorizontal(cell - 1, -1) is not None):
+                return cell
+            cell += d
+        return None
+
+    fringe = BucketPriorityQueue()
+    fringe.push(start, heuristic(start))
+    parents = {start: None} # jump point -> previous jump point
+    g_costs = {start: 0}
+    visited = set()
+
+    while not fringe.isEmpty():
+        cell = fringe.pop()
+        visited.add(cell)
+
+        if cell == goal:
+            # Expand each straight segment between jump points into steps
+            path = []
+            while parents[cell] is not None:
+                parent = parents[cell]
+                delta = cell - parent
+                steps = abs(delta) // stride if delta % stride == 0 else abs(delta)
+                path.extend([directions[delta // steps]] * steps)
+                cell = parent
+            path.reverse()
+            return path
+
+        # Prune the neighbours: keep going straight or turn sideways,
+        # but never step back towards the previous jump point
+        parent = parents[cell]
+        if parent is None:
+            moves = directions
+        elif (cell - parent) % stride == 0:
+            moves = (stride if cell > parent else -stride, -1, 1)
+        else:
+            moves = (1 if cell > parent else -1, -stride, stride)
+
+        for d in moves:
+            if d == 1 or d == -1:
+                jump_point = jumpHorizontal(cell + d, d)
+            else:
+                jump_point = jumpVertical(cell + d, d)
+            if jump_point is None or jump_point in visited:
+                continue
+
+            distance = abs(jump_point - cell)
+            if d != 1 and d != -1:
+                distance //= stride
+            new_g_cost = g_costs[cell] + distance
+            if new_g_cost < g_costs.get(jump_point, INF):
+                g_costs[jump_point] = new_g_cost
+                parents[jump_point] = cell
+                fringe.update(jump_point, new_g_cost + heuristic(jump_point))
+
+    return None # No solution found
@@ -1,8 +1,8 @@
 """
 utils.py
 
-This file contains the data structures (Stack, Queue, PriorityQueue)
-used by the generic search algorithms.
+This file contains the data structures (Stack, Queue, PriorityQueue,
+BucketPriorityQueue) used by the generic search algorithms.
 """
 
 import collections
@@ -10,6 +10,10 @@ import heapq
 
 class Stack:
     "A container with a LIFO (Last-In, First-Out) queuing policy."
+    # A list is kept rather than a deque: append/pop at the end are
+    # already O(1) and slightly faster for LIFO use
+    __slots__ = ('list',)
+
     def __init__(self):
         self.list = []
 
@@ -27,6 +31,8 @@ class Stack:
 
 class Queue:
     "A container with a FIFO (First-In, First-Out) queuing policy."
+    __slots__ = ('queue',)
+
     def __init__(self):
         self.queue = collections.deque()
 
@@ -44,40 +50,137 @@ class Queue:
 
 class PriorityQueue:
     "A container where items are retrieved based on priority."
+    __slots__ = ('heap', 'count', 'entries')
+
+    # Placeholder for entries that were superseded by 'update'
+    REMOVED = object()
+
     def __init__(self):
         self.heap = []
         self.count = 0
+        self.entries = {} # item -> most recent heap entry
 
     def push(self, item, priority):
         "Push 'item' onto the priority queue with 'priority'."
         # We use 'self.count' as a tie-breaker to ensure FIFO
-        # for items with the same priority
-        entry = (priority, self.count, item)
+        # for items with the same priority.
+        # Entries are lists so that 'update' can invalidate them in place.
+        entry = [priority, self.count, item]
+        try:
+            self.entries[item] = entry
+        except TypeError:
+            pass # Unhashable items are queued but not tracked
         heapq.heappush(self.heap, entry)
         self.count += 1
 
     def pop(self):
         "Pop the item with the lowest priority."
-        (_, _, item) = heapq.heappop(self.heap)
-        return item
+        while self.heap:
+            entry = heapq.heappop(self.heap)
+            item = entry[-1]
+            if item is not self.REMOVED:
+                try:
+                    if self.entries.get(item) is entry:
+                        del self.entries[item]
+                except TypeError:
+                    pass # Unhashable items are never tracked
+                return item
+        raise IndexError("pop from an empty priority queue")
 
     def isEmpty(self):
         "Returns true if the priority queue is empty."
+        # Discard invalidated entries so they are not counted
+        while self.heap and self.heap[0][-1] is self.REMOVED:
+            heapq.heappop(self.heap)
         return len(self.heap) == 0
 
     def update(self, item, priority):
         "Update the priority of an existing 'item' in the queue."
-        # This implementation is a bit more complex. For this project,
-        # we'll assume we only push and never update, as A*
-        # with a consistent heuristic doesn't need to re-open nodes
-        # if we also keep track of visited states.
-        # A more robust implementation would search for 'item'
-        # and update its priority.
-        for index, (p, c, i) in enumerate(self.heap):
-            if i == item:
-                if p > priority:
-                    self.heap[index] = (priority, c, item)
-                    heapq.heapify(self.heap)
+        # Instead of searching the heap and re-heapifying, the old entry
+        # is marked as REMOVED and a fresh one is pushed. Invalidated
+        # entries are skipped when they reach the top of the heap.
+        try:
+            entry = self.entries.get(item)
+        except TypeError:
+            # Unhashable items are not tracked, so look for them in the heap
+            entry = next((e for e in self.heap if e[-1] == item), None)
+        if entry is not None:
+            if entry[0] <= priority:
+                return
+            entry[-1] = self.REMOVED
+        # If item not found (or was just invalidated), push it
+        self.push(item, priority)
+
+class BucketPriorityQueue:
+    """
+    A priority queue for small non-negative integer priorities, such as
+    path costs in a maze with unit step costs. Items are kept in one FIFO
+    bucket per priority, so pushing is O(1) and popping only has to skip
+    empty buckets. It has the same interface as PriorityQueue.
+    """
+    __slots__ = ('buckets', 'minPriority', 'entries')
+
+    # Placeholder for entries that were superseded by 'update'
+    REMOVED = object()
+
+    def __init__(self):
+        self.buckets = [] # priority -> deque of [priority, item] entries
+        self.minPriority = 0 # All buckets below this one are empty
+        self.entries = {} # item -> most recent entry
+
+    def push(self, item, priority):
+        "Push 'item' onto the priority queue with integer 'priority'."
+        if not isinstance(priority, int) or priority < 0:
+            raise ValueError(
+                f"Bucket priorities must be non-negative integers, got {priority!r}."
+            )
+        entry = [priority, item]
+        try:
+            self.entries[item] = entry
+        except TypeError:
+            pass # Unhashable items are queued but not tracked
+        # Buckets are added on demand, so there is no upper bound to guess
+        while len(self.buckets) <= priority:
+            self.buckets.append(collections.deque())
+        self.buckets[priority].append(entry)
+        if priority < self.minPriority:
+            self.minPriority = priority
+
+    def pop(self):
+        "Pop the item with the lowest priority."
+        if self.isEmpty():
+            raise IndexError("pop from an empty priority queue")
+        entry = self.buckets[self.minPriority].popleft()
+        item = entry[-1]
+        try:
+            if self.entries.get(item) is entry:
+                del self.entries[item]
+        except TypeError:
+            pass # Unhashable items are never tracked
+        return item
+
+    def isEmpty(self):
+        "Returns true if the priority queue is empty."
+        # Advance to the lowest bucket holding a valid entry
+        while self.minPriority < len(self.buckets):
+            bucket = self.buckets[self.minPriority]
+            while bucket and bucket[0][-1] is self.REMOVED:
+                bucket.popleft()
+            if bucket:
+                return False
+            self.minPriority += 1
+        return True
+
+    def update(self, item, priority):
+        "Update the priority of an existing 'item' in the queue."
+        try:
+            entry = self.entries.get(item)
+        except TypeError:
+            # Unhashable items are not tracked, so look for them in the buckets
+            entry = next((e for bucket in self.buckets for e in bucket
+                          if e[-1] == item), None)
+        if entry is not None:
+            if entry[0] <= priority:
                 return
-        # If item not found, just push it
+            entry[-1] = self.REMOVED
         self.push(item, priority)